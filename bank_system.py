@@ -1,67 +1,282 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 import calendar
+import re
 from decimal import Decimal, ROUND_HALF_UP
 
+# Amounts are held as int cents and rates as int hundredths of a percent;
+# Decimal is only used to parse input and to hand values back to callers
+CENT = Decimal('0.01')
+
+# Interest in dollars = balance_cents * rate_bp * days / INTEREST_DIVISOR
+# (cents -> dollars, hundredths of a percent -> fraction, days -> years)
+INTEREST_DIVISOR = 100 * 100 * 100 * 365
+
+def to_cents(value):
+    """Round a monetary value to 2 decimal places and return it as int cents"""
+    return int(Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+
+def from_cents(cents):
+    """Convert int cents back to a 2 decimal place Decimal"""
+    return Decimal(cents).scaleb(-2)
+
+def format_cents(cents):
+    """Format int cents as a plain 2 decimal place string"""
+    sign = '-' if cents < 0 else ''
+    cents = abs(cents)
+    return f"{sign}{cents // 100}.{cents % 100:02d}"
+
+# Exactly eight ASCII digits; str.isdigit() would also accept other scripts'
+# digits, which strptime rejects
+_YYYYMMDD = re.compile(r'[0-9]{8}')
+
+def parse_date(date_str):
+    """Parse a YYYYMMDD string into a date, returning None if it is invalid"""
+    try:
+        if _YYYYMMDD.fullmatch(date_str):
+            return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+        # Fall back to strptime for the shorter forms it also accepts
+        return datetime.strptime(date_str, "%Y%m%d").date()
+    except ValueError:
+        return None
+
+def parse_transaction_line(line):
+    """Split a <Date> <Account> <Type> <Amount> line, returning None if malformed"""
+    parts = line.split()
+    if len(parts) != 4:
+        return None
+    return tuple(parts)
+
+def sweep_interest(change_days, change_balances, rate_days, rates_bp,
+                   start_day, end_day, balance, rate):
+    """Accumulate balance_cents * rate_bp * days over [start_day, end_day].
+    
+    Days are date ordinals. change_balances[i] is the balance in cents at the
+    end of change_days[i] and rates_bp[j] takes effect on rate_days[j]; both
+    day lists are sorted and within the period. balance and rate are the
+    values carried in from before start_day. Only plain ints are used so the
+    loop stays cheap and can be handed to a JIT compiler unchanged.
+    """
+    total = 0
+    txn_idx, rule_idx = 0, 0
+    num_changes, num_rates = len(change_days), len(rate_days)
+    day = start_day
+    
+    while True:
+        # Apply every balance and rule change effective at the end of day
+        while txn_idx < num_changes and change_days[txn_idx] == day:
+            balance = change_balances[txn_idx]
+            txn_idx += 1
+        while rule_idx < num_rates and rate_days[rule_idx] == day:
+            rate = rates_bp[rule_idx]
+            rule_idx += 1
+        
+        # A change on the last day of the period does not accrue that day
+        if day == end_day:
+            break
+        
+        # The period runs until the next change or the end of the range
+        next_day = end_day + 1
+        if txn_idx < num_changes:
+            next_day = change_days[txn_idx]
+        if rule_idx < num_rates and rate_days[rule_idx] < next_day:
+            next_day = rate_days[rule_idx]
+        
+        total += balance * rate * (next_day - day)
+        
+        if next_day > end_day:
+            break
+        day = next_day
+    
+    return total
+
+# Balance effect of each transaction type; other types leave it unchanged
+TRANSACTION_SIGNS = {'D': 1, 'W': -1, 'I': 1}
+
 class Transaction:
+    __slots__ = ('date', 'date_ord', 'date_str', 'account', 'transaction_type', 'amount_cents',
+                 'signed_cents', 'txn_id')
+    
     def __init__(self, date, account, transaction_type, amount, txn_id=None):
         self.date = date
+        self.date_ord = date.toordinal()  # Int form used by balance and interest helpers
+        self.date_str = date.strftime("%Y%m%d")  # Formatted once for printing
         self.account = account
         self.transaction_type = transaction_type.upper()
-        self.amount = Decimal(amount).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        self.amount_cents = to_cents(amount)
+        # Effect on the balance, so accumulation loops need no type dispatch
+        self.signed_cents = TRANSACTION_SIGNS.get(self.transaction_type, 0) * self.amount_cents
         self.txn_id = txn_id
+    
+    @property
+    def amount(self):
+        return from_cents(self.amount_cents)
 
 class InterestRule:
+    __slots__ = ('date', 'date_ord', 'date_str', 'rule_id', 'rate_bp')
+    
     def __init__(self, date, rule_id, rate):
         self.date = date
+        self.date_ord = date.toordinal()  # Int form used by interest helpers
+        self.date_str = date.strftime("%Y%m%d")  # Formatted once for printing
         self.rule_id = rule_id
-        self.rate = Decimal(rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        self.rate_bp = to_cents(rate)
+    
+    @property
+    def rate(self):
+        return from_cents(self.rate_bp)
 
 class BankAccount:
     def __init__(self, account_id):
         self.account_id = account_id
-        self.transactions = []
+        self._transactions = []  # In insertion order
+        # Transactions in statement order (by date, then txn ID) with parallel
+        # int columns: _sorted_days[i] is the date ordinal of _sorted_txns[i]
+        # and _cum_balances[i] the balance in cents once it is applied, so
+        # lookups can bisect plain ints instead of rescanning objects
+        self._sorted_txns = []
+        self._sorted_days = []
+        self._cum_balances = []
+        # (year, month) of every interest transaction, kept in step with the
+        # transactions so it can never disagree with them
+        self._interest_months = set()
+        # Read-only tuples of _transactions and _sorted_txns, built on first
+        # read and dropped whenever a transaction is added
+        self._transactions_view = None
+        self._sorted_view = None
         
     def add_transaction(self, transaction):
-        self.transactions.append(transaction)
+        self._transactions.append(transaction)
+        self._transactions_view = self._sorted_view = None
+        if transaction.transaction_type == 'I':
+            self._interest_months.add((transaction.date.year, transaction.date.month))
+        
+        delta = transaction.signed_cents
+        
+        # Find the statement position; transactions normally arrive in date
+        # order, in which case this is the end of the list
+        day = transaction.date_ord
+        idx = bisect_right(self._sorted_days, day)
+        txn_key = transaction.txn_id or ""
+        while (idx and self._sorted_days[idx - 1] == day
+               and (self._sorted_txns[idx - 1].txn_id or "") > txn_key):
+            idx -= 1
+        
+        previous = self._cum_balances[idx - 1] if idx else 0
+        self._sorted_txns.insert(idx, transaction)
+        self._sorted_days.insert(idx, day)
+        self._cum_balances.insert(idx, previous + delta)
+        
+        # Back-dated transaction: shift every later checkpoint
+        for i in range(idx + 1, len(self._cum_balances)):
+            self._cum_balances[i] += delta
+    
+    def add_transactions(self, transactions):
+        """Add several transactions, as repeated add_transaction calls would.
+        
+        The sorted columns are rebuilt once for the whole batch instead of
+        shifting later checkpoints after every back-dated insert.
+        """
+        count = len(self._transactions)
+        self._transactions.extend(transactions)
+        if len(self._transactions) == count:
+            return
+        self._transactions_view = self._sorted_view = None
+        
+        # The sort is stable, so transactions with the same date and ID stay
+        # in insertion order, exactly where add_transaction would put them
+        self._interest_months.update(
+            (t.date.year, t.date.month) for t in self._transactions[count:] if t.transaction_type == 'I'
+        )
+        sorted_txns = sorted(self._transactions, key=lambda t: (t.date_ord, t.txn_id or ""))
+        self._sorted_txns = sorted_txns
+        self._sorted_days = [t.date_ord for t in sorted_txns]
+        self._cum_balances = list(accumulate(t.signed_cents for t in sorted_txns))
+    
+    @property
+    def transactions(self):
+        """Transactions in insertion order, as a tuple so the sorted index cannot be bypassed"""
+        if self._transactions_view is None:
+            self._transactions_view = tuple(self._transactions)
+        return self._transactions_view
+    
+    def has_interest_for(self, year, month):
+        """Check if an interest transaction has been posted for the given month"""
+        return (year, month) in self._interest_months
+    
+    def get_sorted_transactions(self):
+        """Return transactions ordered by date and ID, as a tuple"""
+        if self._sorted_view is None:
+            self._sorted_view = tuple(self._sorted_txns)
+        return self._sorted_view
+    
+    def get_balance_cents_at_day(self, day):
+        """Calculate balance in cents at the end of the given date ordinal"""
+        idx = bisect_right(self._sorted_days, day)
+        return self._cum_balances[idx - 1] if idx else 0
+    
+    def get_balance_cents_at_date(self, target_date):
+        """Calculate balance in cents at the end of the given date"""
+        return self.get_balance_cents_at_day(target_date.toordinal())
+        
+    def _index_range(self, start_day, end_day):
+        """Return the [lo, hi) slice of sorted transactions between the given date ordinals"""
+        lo = bisect_left(self._sorted_days, start_day)
+        hi = bisect_right(self._sorted_days, end_day, lo)
+        return lo, hi
+    
+    def has_transactions_until(self, end_date):
+        """Check if any transaction falls on or before the given date"""
+        return bool(self._sorted_days) and self._sorted_days[0] <= end_date.toordinal()
+    
+    def get_transactions_between(self, start_date, end_date):
+        """Return transactions between the given dates, ordered by date and ID"""
+        lo, hi = self._index_range(start_date.toordinal(), end_date.toordinal())
+        return self._sorted_txns[lo:hi]
+        
+    def get_balance_checkpoints(self, start_day, end_day):
+        """Return (date ordinals, balances in cents) for transactions between the given date ordinals"""
+        lo, hi = self._index_range(start_day, end_day)
+        return self._sorted_days[lo:hi], self._cum_balances[lo:hi]
         
     def get_balance_at_date(self, target_date):
         """Calculate balance at the end of the given date"""
-        balance = Decimal('0')
-        for txn in self.transactions:
-            if txn.date <= target_date:
-                if txn.transaction_type == 'D':
-                    balance += txn.amount
-                elif txn.transaction_type == 'W':
-                    balance -= txn.amount
-                elif txn.transaction_type == 'I':
-                    balance += txn.amount
-        return balance
+        return from_cents(self.get_balance_cents_at_date(target_date))
 
     def can_withdraw(self, amount, date):
         """Check if withdrawal is possible (balance won't go negative)"""
-        current_balance = self.get_balance_at_date(date)
-        return current_balance >= amount
+        # Compare against the exact amount; rounding it first would let a
+        # sub-cent excess through
+        return from_cents(self.get_balance_cents_at_date(date)) >= amount
 
 class BankSystem:
     def __init__(self):
         self.accounts = {}
-        self.interest_rules = []
+        self._interest_rules = []
+        self._rule_days = []  # Date ordinals parallel to _interest_rules, for bisect lookups
+        self._interest_rules_view = ()  # Read-only copy of _interest_rules, rebuilt on change
         self.transaction_counters = {}  # Format: {date: count}
     
+    @property
+    def interest_rules(self):
+        """Interest rules sorted by date, as a tuple; use add_interest_rule to change them"""
+        return self._interest_rules_view
+    
     def create_transaction(self, date_str, account_id, txn_type, amount_str):
         # Validate date format
-        try:
-            date = datetime.strptime(date_str, "%Y%m%d").date()
-        except ValueError:
+        date = parse_date(date_str)
+        if date is None:
             return False, "Invalid date format. Please use YYYYMMDD format."
         
         # Validate transaction type
-        if txn_type.upper() not in ['D', 'W']:
+        txn_type = txn_type.upper()
+        if txn_type not in ('D', 'W'):
             return False, "Invalid transaction type. Use D for deposit or W for withdrawal."
         
         # Validate amount
         try:
-            amount = Decimal(amount_str).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            amount = Decimal(amount_str).quantize(CENT, rounding=ROUND_HALF_UP)
             if amount <= 0:
                 return False, "Amount must be greater than zero."
         except:
@@ -74,7 +289,7 @@ class BankSystem:
         account = self.accounts[account_id]
         
         # Check if withdrawal is possible
-        if txn_type.upper() == 'W' and not account.can_withdraw(amount, date):
+        if txn_type == 'W' and not account.can_withdraw(amount, date):
             return False, "Insufficient funds for withdrawal."
         
         # Generate transaction ID
@@ -90,30 +305,50 @@ class BankSystem:
         
         return True, account_id
     
+    def load_transactions(self, lines):
+        """Create transactions from <Date> <Account> <Type> <Amount> lines in bulk.
+        
+        Blank lines are skipped. Returns a (success, message) result for every
+        other line, in order, as create_transaction would.
+        """
+        results = []
+        create_transaction = self.create_transaction
+        for line in lines:
+            if not line or line.isspace():
+                continue
+            
+            parts = parse_transaction_line(line)
+            if parts is None:
+                results.append((False, "Invalid input format."))
+            else:
+                results.append(create_transaction(*parts))
+        
+        return results
+    
     def add_interest_rule(self, date_str, rule_id, rate_str):
         # Validate date format
-        try:
-            date = datetime.strptime(date_str, "%Y%m%d").date()
-        except ValueError:
+        date = parse_date(date_str)
+        if date is None:
             return False, "Invalid date format. Please use YYYYMMDD format."
         
         # Validate rate
         try:
-            rate = Decimal(rate_str).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            rate = Decimal(rate_str).quantize(CENT, rounding=ROUND_HALF_UP)
             if rate <= 0 or rate >= 100:
                 return False, "Interest rate must be greater than 0 and less than 100."
         except:
             return False, "Invalid rate format."
         
-        # Remove any existing rule for the same date
-        self.interest_rules = [rule for rule in self.interest_rules if rule.date != date]
-        
-        # Add new rule
         rule = InterestRule(date, rule_id, rate)
-        self.interest_rules.append(rule)
         
-        # Sort rules by date
-        self.interest_rules.sort(key=lambda x: x.date)
+        # Keep rules sorted by date, replacing any existing rule for the same date
+        idx = bisect_left(self._rule_days, rule.date_ord)
+        if idx < len(self._rule_days) and self._rule_days[idx] == rule.date_ord:
+            self._interest_rules[idx] = rule
+        else:
+            self._rule_days.insert(idx, rule.date_ord)
+            self._interest_rules.insert(idx, rule)
+        self._interest_rules_view = tuple(self._interest_rules)
         
         return True, None
     
@@ -124,82 +359,48 @@ class BankSystem:
         
         account = self.accounts[account_id]
         
+        # Skip if interest was already calculated for this month
+        if account.has_interest_for(year, month):
+            return None
+        
         # Determine the last day of the month
         _, last_day = calendar.monthrange(year, month)
         start_date = datetime(year, month, 1).date()
         end_date = datetime(year, month, last_day).date()
         
-        # Get all relevant transactions for this account up to the end of the month
-        account_txns = [t for t in account.transactions if t.date <= end_date]
-        if not account_txns:
-            return None
-        
-        # Filter out any existing interest transactions for this month
-        interest_txns = [t for t in account_txns 
-                        if t.transaction_type == 'I' and 
-                        t.date.year == year and 
-                        t.date.month == month]
-        
-        if interest_txns:
-            # Interest already calculated for this month
+        # Nothing to do for an account with no transactions up to the end of the month
+        if not account.has_transactions_until(end_date):
             return None
         
-        # Find all balance change dates in the month
-        balance_change_dates = set()
-        for txn in account_txns:
-            if start_date <= txn.date <= end_date:
-                balance_change_dates.add(txn.date)
-        
-        # Add interest rule change dates that fall within the month
-        for rule in self.interest_rules:
-            if start_date <= rule.date <= end_date:
-                balance_change_dates.add(rule.date)
-        
-        # Add the start of the month and start of any interest rules from previous months
-        balance_change_dates.add(start_date)
-        
-        # Sort the dates
-        balance_change_dates = sorted(balance_change_dates)
-        
-        # Calculate interest for each period
-        total_interest = Decimal('0')
-        
-        for i in range(len(balance_change_dates)):
-            current_date = balance_change_dates[i]
-            
-            # Skip if this is the last date in the month
-            if current_date == end_date:
-                continue
-                
-            # Determine the end date for this period
-            next_date = balance_change_dates[i+1] if i+1 < len(balance_change_dates) else end_date + timedelta(days=1)
-            period_end = next_date - timedelta(days=1)
-            
-            # Calculate number of days in this period
-            num_days = (next_date - current_date).days
-            
-            # Get the balance at the end of the current date
-            balance = account.get_balance_at_date(current_date)
-            
-            # Find the applicable interest rule
-            applicable_rule = None
-            for rule in self.interest_rules:
-                if rule.date <= current_date:
-                    applicable_rule = rule
-            
-            if applicable_rule:
-                # Calculate interest for this period
-                daily_interest = (balance * applicable_rule.rate / 100 * num_days) / 365
-                total_interest += daily_interest
-        
-        # Round the total interest to 2 decimal places
-        total_interest = total_interest.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        # Balance checkpoints and rule changes that fall within the month
+        start_day, end_day = start_date.toordinal(), end_date.toordinal()
+        change_days, change_balances = account.get_balance_checkpoints(start_day, end_day)
+        rule_lo = bisect_left(self._rule_days, start_day)
+        rule_hi = bisect_right(self._rule_days, end_day, rule_lo)
+        
+        # Balance and rate carried in from before the month
+        initial_balance = account.get_balance_cents_at_day(start_day - 1)
+        initial_rate = self._interest_rules[rule_lo - 1].rate_bp if rule_lo else 0
+        
+        total_interest = sweep_interest(
+            change_days,
+            change_balances,
+            self._rule_days[rule_lo:rule_hi],
+            [rule.rate_bp for rule in self._interest_rules[rule_lo:rule_hi]],
+            start_day,
+            end_day,
+            initial_balance,
+            initial_rate,
+        )
+        
+        # Round the total interest to whole cents in a single Decimal step
+        total_interest = to_cents(Decimal(total_interest) / INTEREST_DIVISOR)
         
         if total_interest > 0:
             # Create an interest transaction for the last day of the month
-            interest_txn = Transaction(end_date, account_id, 'I', total_interest)
+            interest_txn = Transaction(end_date, account_id, 'I', from_cents(total_interest))
             account.add_transaction(interest_txn)
-            return total_interest
+            return interest_txn.amount
         
         return Decimal('0')
     
@@ -210,32 +411,31 @@ class BankSystem:
         
         account = self.accounts[account_id]
         
-        output = [f"Account: {account_id}"]
+        # Transactions are already kept sorted by date and ID
+        sorted_txns = account.get_sorted_transactions()
+        
+        # One output line per transaction plus the two header lines
+        output = [None] * (len(sorted_txns) + 2)
+        output[0] = f"Account: {account_id}"
         
         if with_balance:
-            output.append("| Date     | Txn Id      | Type | Amount | Balance |")
+            output[1] = "| Date     | Txn Id      | Type | Amount | Balance |"
+            row = "| {} | {:10} | {}    | {:>6} | {:>7} |".format
         else:
-            output.append("| Date     | Txn Id      | Type | Amount |")
+            output[1] = "| Date     | Txn Id      | Type | Amount |"
+            row = "| {} | {:10} | {}    | {:>6} |".format
         
-        # Sort transactions by date and ID
-        sorted_txns = sorted(account.transactions, key=lambda x: (x.date, x.txn_id or ""))
+        running_balance = 0
         
-        running_balance = Decimal('0')
-        
-        for txn in sorted_txns:
-            date_str = txn.date.strftime("%Y%m%d")
-            
-            if txn.transaction_type == 'D':
-                running_balance += txn.amount
-            elif txn.transaction_type == 'W':
-                running_balance -= txn.amount
-            elif txn.transaction_type == 'I':
-                running_balance += txn.amount
+        for i, txn in enumerate(sorted_txns, 2):
+            running_balance += txn.signed_cents
             
             if with_balance:
-                output.append(f"| {date_str} | {txn.txn_id or '':10} | {txn.transaction_type}    | {txn.amount:>6.2f} | {running_balance:>7.2f} |")
+                output[i] = row(txn.date_str, txn.txn_id or '', txn.transaction_type,
+                                format_cents(txn.amount_cents), format_cents(running_balance))
             else:
-                output.append(f"| {date_str} | {txn.txn_id or '':10} | {txn.transaction_type}    | {txn.amount:>6.2f} |")
+                output[i] = row(txn.date_str, txn.txn_id or '', txn.transaction_type,
+                                format_cents(txn.amount_cents))
         
         return "\n".join(output)
     
@@ -264,47 +464,40 @@ class BankSystem:
         
         account = self.accounts[account_id]
         
-        # Filter transactions for this month
-        month_txns = [t for t in account.transactions if start_date <= t.date <= end_date]
+        # Slice out this month's transactions, already sorted by date and ID
+        month_txns = account.get_transactions_between(start_date, end_date)
         
         if not month_txns:
             return f"No transactions found for account {account_id} in {year_month}."
         
-        output = [f"Account: {account_id}"]
-        output.append("| Date     | Txn Id      | Type | Amount | Balance |")
-        
-        # Sort transactions by date and ID
-        sorted_txns = sorted(month_txns, key=lambda x: (x.date, x.txn_id or ""))
+        # One output line per transaction plus the two header lines
+        output = [None] * (len(month_txns) + 2)
+        output[0] = f"Account: {account_id}"
+        output[1] = "| Date     | Txn Id      | Type | Amount | Balance |"
+        row = "| {} | {:11} | {}    | {:>6} | {:>7} |".format
         
         # Calculate the starting balance at the beginning of the month
-        starting_balance = account.get_balance_at_date(start_date - timedelta(days=1))
+        starting_balance = account.get_balance_cents_at_date(start_date - timedelta(days=1))
         running_balance = starting_balance
         
-        for txn in sorted_txns:
-            date_str = txn.date.strftime("%Y%m%d")
-            
-            if txn.transaction_type == 'D':
-                running_balance += txn.amount
-            elif txn.transaction_type == 'W':
-                running_balance -= txn.amount
-            elif txn.transaction_type == 'I':
-                running_balance += txn.amount
+        for i, txn in enumerate(month_txns, 2):
+            running_balance += txn.signed_cents
             
-            output.append(f"| {date_str} | {txn.txn_id or '':11} | {txn.transaction_type}    | {txn.amount:>6.2f} | {running_balance:>7.2f} |")
+            output[i] = row(txn.date_str, txn.txn_id or '', txn.transaction_type,
+                            format_cents(txn.amount_cents), format_cents(running_balance))
         
         return "\n".join(output)
     
     def print_interest_rules(self):
         """Print all interest rules"""
-        if not self.interest_rules:
+        if not self._interest_rules:
             return "No interest rules defined."
         
         output = ["Interest rules:"]
         output.append("| Date     | RuleId | Rate (%) |")
         
-        for rule in self.interest_rules:
-            date_str = rule.date.strftime("%Y%m%d")
-            output.append(f"| {date_str} | {rule.rule_id} | {rule.rate:>8.2f} |")
+        for rule in self._interest_rules:
+            output.append(f"| {rule.date_str} | {rule.rule_id} | {format_cents(rule.rate_bp):>8} |")
         
         return "\n".join(output)
 
@@ -329,13 +522,12 @@ def main():
                 if not transaction_input:
                     break
                 
-                parts = transaction_input.split()
-                if len(parts) != 4:
+                parts = parse_transaction_line(transaction_input)
+                if parts is None:
                     print("Invalid input format. Please try again.")
                     continue
                 
-                date_str, account_id, txn_type, amount_str = parts
-                success, message = bank_system.create_transaction(date_str, account_id, txn_type, amount_str)
+                success, message = bank_system.create_transaction(*parts)
                 
                 if success:
                     print(bank_system.print_account_transactions(message))
@@ -1,112 +1,215 @@
 import pytest
+import calendar
+import copy
 from datetime import datetime, timedelta
+from functools import lru_cache
 from decimal import Decimal
 import sys
-import io
-from unittest.mock import patch
 
 # Import the bank system module
-from bank_system import Transaction, InterestRule, BankAccount, BankSystem
+import bank_system as bank_system_module
+from bank_system import Transaction, InterestRule, BankAccount, BankSystem, sweep_interest
+
+# ------------------- Date Constants -------------------
+@lru_cache(maxsize=None)
+def d(year, month, day):
+    """Build (and cache) a date from its parts"""
+    return datetime(year, month, day).date()
+
+TEST_DATES = {
+    "date1": d(2023, 1, 1),
+    "date2": d(2023, 1, 15),
+    "date3": d(2023, 1, 31),
+    "in_between": d(2023, 1, 10),
+    "after": d(2023, 2, 1)
+}
+
+# ------------------- Decimal Constants -------------------
+D_0 = Decimal("0")
+D_3_85 = Decimal("3.85")
+D_4 = Decimal("4.00")
+D_4_25 = Decimal("4.25")
+D_4_71 = Decimal("4.71")
+D_5_08 = Decimal("5.08")
+D_5_13 = Decimal("5.13")
+D_5_25 = Decimal("5.25")
+D_100 = Decimal("100.00")
+D_100_46 = Decimal("100.46")
+D_200 = Decimal("200.00")
+D_300 = Decimal("300.00")
+D_305 = Decimal("305.00")
+D_400 = Decimal("400.00")
+D_450 = Decimal("450.00")
+D_500 = Decimal("500.00")
+D_600 = Decimal("600.00")
+D_800 = Decimal("800.00")
+D_1000 = Decimal("1000.00")
+
+# ------------------- Output Helpers -------------------
+def missing_tokens(tokens, output):
+    """Return the tokens that do not appear anywhere in the output"""
+    return {t for t in tokens if t not in output}
+
+TRANSACTION_TOKENS = ("ACC001", "20230101", "D", "1000.00", "20230115", "W", "200.00")
+# The interest transaction is posted on the last day of the month with no txn ID
+INTEREST_ROW = "| 20230131 |             | I    |"
+RULE_TOKENS = ("Interest rules", "RULE1", "RULE2", "5.00", "5.50")
+# Transaction dates plus the interest date at the end of each month
+JANUARY_TOKENS = ("20230101", "20230110", "20230115", "20230120", "20230131")
+FEBRUARY_TOKENS = ("20230205", "20230220", "20230228")
+
+# ------------------- Setup Helpers -------------------
+def _bulk(bank, txns, rules=()):
+    """Add the interest rules, then the transactions, failing on any rejected setup call"""
+    add_interest_rule = bank.add_interest_rule
+    create_transaction = bank.create_transaction
+    for rule in rules:
+        success, message = add_interest_rule(*rule)
+        assert success, message
+    for txn in txns:
+        success, message = create_transaction(*txn)
+        assert success, message
 
 # ------------------- Transaction Tests -------------------
 def test_transaction_initialization():
-    date = datetime(2023, 1, 15).date()
+    date = d(2023, 1, 15)
     txn = Transaction(date, "ACC001", "d", "100.456")
     
     assert txn.date == date
     assert txn.account == "ACC001"
     assert txn.transaction_type == "D"  # Should be uppercase
-    assert txn.amount == Decimal("100.46")  # Should round to 2 decimal places
+    assert txn.amount == D_100_46  # Should round to 2 decimal places
     assert txn.txn_id is None  # ID should be None if not provided
 
 def test_transaction_with_id():
-    date = datetime(2023, 1, 15).date()
+    date = d(2023, 1, 15)
     txn = Transaction(date, "ACC001", "W", "50.00", "20230115-01")
     
     assert txn.txn_id == "20230115-01"
     assert txn.transaction_type == "W"
+    assert txn.signed_cents == -5000  # Withdrawals reduce the balance
 
 # ------------------- InterestRule Tests -------------------
 def test_interest_rule_initialization():
-    date = datetime(2023, 1, 1).date()
+    date = d(2023, 1, 1)
     rule = InterestRule(date, "RULE1", "5.125")
     
     assert rule.date == date
     assert rule.rule_id == "RULE1"
-    assert rule.rate == Decimal("5.13")  # Should round to 2 decimal places
+    assert rule.rate == D_5_13  # Should round to 2 decimal places
 
 # ------------------- BankAccount Tests -------------------
 @pytest.fixture
 def bank_account():
-    account = BankAccount("ACC001")
-    return account
+    return BankAccount("ACC001")
 
-@pytest.fixture
-def test_dates():
-    return {
-        "date1": datetime(2023, 1, 1).date(),
-        "date2": datetime(2023, 1, 15).date(),
-        "date3": datetime(2023, 1, 31).date(),
-        "in_between": datetime(2023, 1, 10).date(),
-        "after": datetime(2023, 2, 1).date()
-    }
-
-def test_add_transaction(bank_account, test_dates):
-    txn = Transaction(test_dates["date1"], "ACC001", "D", "100.00")
+def test_add_transaction(bank_account):
+    txn = Transaction(TEST_DATES["date1"], "ACC001", "D", "100.00")
     bank_account.add_transaction(txn)
     
     assert len(bank_account.transactions) == 1
     assert bank_account.transactions[0] == txn
-
-def test_get_balance_at_date_with_deposits_only(bank_account, test_dates):
-    bank_account.add_transaction(Transaction(test_dates["date1"], "ACC001", "D", "100.00"))
-    bank_account.add_transaction(Transaction(test_dates["date2"], "ACC001", "D", "200.00"))
     
-    # Check balance at different dates
-    assert bank_account.get_balance_at_date(test_dates["date1"]) == Decimal("100.00")
-    assert bank_account.get_balance_at_date(test_dates["date2"]) == Decimal("300.00")
-    # Date in-between transactions
-    assert bank_account.get_balance_at_date(test_dates["in_between"]) == Decimal("100.00")
-    # Date after all transactions
-    assert bank_account.get_balance_at_date(test_dates["after"]) == Decimal("300.00")
+    # Both views are read-only so the sorted index cannot go stale
+    with pytest.raises(AttributeError):
+        bank_account.transactions.clear()
+    with pytest.raises(AttributeError):
+        bank_account.get_sorted_transactions().clear()
+
+@pytest.fixture(scope="module")
+def two_deposit_account():
+    # Only read by the tests below, so it is built once for the module
+    account = BankAccount("ACC001")
+    account.add_transaction(Transaction(TEST_DATES["date1"], "ACC001", "D", "100.00"))
+    account.add_transaction(Transaction(TEST_DATES["date2"], "ACC001", "D", "200.00"))
+    return account
+
+@pytest.mark.parametrize("date_key, expected", [
+    ("date1", D_100),
+    ("date2", D_300),
+    ("in_between", D_100),  # Date in-between transactions
+    ("after", D_300),  # Date after all transactions
+], ids=["date1", "date2", "in_between", "after"])
+def test_get_balance_at_date_with_deposits_only(two_deposit_account, date_key, expected):
+    assert two_deposit_account.get_balance_at_date(TEST_DATES[date_key]) == expected
 
-def test_get_balance_at_date_with_mixed_transactions(bank_account, test_dates):
-    bank_account.add_transaction(Transaction(test_dates["date1"], "ACC001", "D", "500.00"))
-    bank_account.add_transaction(Transaction(test_dates["date2"], "ACC001", "W", "200.00"))
-    bank_account.add_transaction(Transaction(test_dates["date3"], "ACC001", "I", "5.00"))
+def test_get_balance_at_date_with_mixed_transactions(bank_account):
+    bank_account.add_transaction(Transaction(TEST_DATES["date1"], "ACC001", "D", "500.00"))
+    bank_account.add_transaction(Transaction(TEST_DATES["date2"], "ACC001", "W", "200.00"))
+    bank_account.add_transaction(Transaction(TEST_DATES["date3"], "ACC001", "I", "5.00"))
+    
+    assert bank_account.get_balance_at_date(TEST_DATES["date1"]) == D_500
+    assert bank_account.get_balance_at_date(TEST_DATES["date2"]) == D_300
+    assert bank_account.get_balance_at_date(TEST_DATES["date3"]) == D_305
+
+def test_get_balance_at_date_with_backdated_transaction(bank_account):
+    bank_account.add_transaction(Transaction(TEST_DATES["date3"], "ACC001", "D", "100.00"))
+    bank_account.add_transaction(Transaction(TEST_DATES["date1"], "ACC001", "D", "500.00"))
+    bank_account.add_transaction(Transaction(TEST_DATES["date2"], "ACC001", "W", "200.00"))
+    
+    # Later balances must reflect transactions inserted before them
+    assert bank_account.get_balance_at_date(TEST_DATES["date1"]) == D_500
+    assert bank_account.get_balance_at_date(TEST_DATES["date2"]) == D_300
+    assert bank_account.get_balance_at_date(TEST_DATES["date3"]) == D_400
+
+def test_add_transactions_matches_add_transaction(bank_account):
+    # Out of date order, with two transactions sharing a date
+    txns = [
+        Transaction(TEST_DATES["date3"], "ACC001", "D", "100.00", "20230131-01"),
+        Transaction(TEST_DATES["date1"], "ACC001", "D", "500.00", "20230101-02"),
+        Transaction(TEST_DATES["date1"], "ACC001", "D", "50.00", "20230101-01"),
+        Transaction(TEST_DATES["date2"], "ACC001", "W", "200.00", "20230115-01"),
+    ]
+    one_by_one = BankAccount("ACC001")
+    for txn in txns:
+        one_by_one.add_transaction(txn)
     
-    assert bank_account.get_balance_at_date(test_dates["date1"]) == Decimal("500.00")
-    assert bank_account.get_balance_at_date(test_dates["date2"]) == Decimal("300.00")
-    assert bank_account.get_balance_at_date(test_dates["date3"]) == Decimal("305.00")
+    bank_account.add_transactions(iter(txns))
+    
+    assert bank_account.transactions == tuple(txns)
+    assert bank_account.get_sorted_transactions() == one_by_one.get_sorted_transactions()
+    for key in ("date1", "date2", "date3"):
+        assert bank_account.get_balance_at_date(TEST_DATES[key]) == one_by_one.get_balance_at_date(TEST_DATES[key])
+    assert bank_account.get_balance_at_date(TEST_DATES["date3"]) == D_450
 
-def test_can_withdraw(bank_account, test_dates):
-    bank_account.add_transaction(Transaction(test_dates["date1"], "ACC001", "D", "500.00"))
+def test_can_withdraw(bank_account):
+    bank_account.add_transaction(Transaction(TEST_DATES["date1"], "ACC001", "D", "500.00"))
     
     # Check if withdrawals are possible
-    assert bank_account.can_withdraw(Decimal("500.00"), test_dates["date1"]) is True
-    assert bank_account.can_withdraw(Decimal("300.00"), test_dates["date1"]) is True
-    assert bank_account.can_withdraw(Decimal("600.00"), test_dates["date1"]) is False
+    assert bank_account.can_withdraw(D_500, TEST_DATES["date1"]) is True
+    assert bank_account.can_withdraw(D_300, TEST_DATES["date1"]) is True
+    assert bank_account.can_withdraw(D_600, TEST_DATES["date1"]) is False
+    # The amount is not rounded before the comparison
+    assert bank_account.can_withdraw(Decimal("500.004"), TEST_DATES["date1"]) is False
     
     # Add a withdrawal and check again
-    bank_account.add_transaction(Transaction(test_dates["date2"], "ACC001", "W", "200.00"))
-    assert bank_account.can_withdraw(Decimal("400.00"), test_dates["date2"]) is False
-    assert bank_account.can_withdraw(Decimal("300.00"), test_dates["date2"]) is True
+    bank_account.add_transaction(Transaction(TEST_DATES["date2"], "ACC001", "W", "200.00"))
+    assert bank_account.can_withdraw(D_400, TEST_DATES["date2"]) is False
+    assert bank_account.can_withdraw(D_300, TEST_DATES["date2"]) is True
 
 # ------------------- BankSystem Tests -------------------
 @pytest.fixture
 def bank_system():
     return BankSystem()
 
+@pytest.fixture(scope="session")
+def readonly_bank_system():
+    # Shared by tests whose calls are rejected before touching any state
+    return BankSystem()
+
 def test_create_transaction_deposit(bank_system):
     success, message = bank_system.create_transaction("20230101", "ACC001", "D", "100.00")
     
     assert success is True
     assert message == "ACC001"  # Should return account ID
     assert "ACC001" in bank_system.accounts
-    assert len(bank_system.accounts["ACC001"].transactions) == 1
-    assert bank_system.accounts["ACC001"].transactions[0].amount == Decimal("100.00")
-    assert bank_system.accounts["ACC001"].transactions[0].transaction_type == "D"
-    assert bank_system.accounts["ACC001"].transactions[0].txn_id == "20230101-01"
+    
+    txns = bank_system.accounts["ACC001"].transactions
+    assert len(txns) == 1
+    txn = txns[-1]
+    assert txn.amount == D_100
+    assert txn.transaction_type == "D"
+    assert txn.txn_id == "20230101-01"
 
 def test_create_transaction_withdrawal(bank_system):
     # Create a deposit first
@@ -116,10 +219,13 @@ def test_create_transaction_withdrawal(bank_system):
     success, message = bank_system.create_transaction("20230102", "ACC001", "W", "200.00")
     
     assert success is True
-    assert len(bank_system.accounts["ACC001"].transactions) == 2
-    assert bank_system.accounts["ACC001"].transactions[1].amount == Decimal("200.00")
-    assert bank_system.accounts["ACC001"].transactions[1].transaction_type == "W"
-    assert bank_system.accounts["ACC001"].transactions[1].txn_id == "20230102-01"
+    
+    txns = bank_system.accounts["ACC001"].transactions
+    assert len(txns) == 2
+    txn = txns[-1]
+    assert txn.amount == D_200
+    assert txn.transaction_type == "W"
+    assert txn.txn_id == "20230102-01"
 
 def test_create_transaction_insufficient_funds(bank_system):
     # Try withdrawal without sufficient funds
@@ -130,14 +236,33 @@ def test_create_transaction_insufficient_funds(bank_system):
 
 @pytest.mark.parametrize("date, account, txn_type, amount, expected_message", [
     ("2023-01-01", "ACC001", "D", "100.00", "Invalid date format"),
+    ("\uff12\uff10\uff12\uff13\uff10\uff11\uff10\uff11", "ACC001", "D", "100.00", "Invalid date format"),  # Fullwidth digits
     ("20230101", "ACC001", "X", "100.00", "Invalid transaction type"),
     ("20230101", "ACC001", "D", "-100.00", "Amount must be greater than zero"),
     ("20230101", "ACC001", "D", "abc", "Invalid amount format"),
-])
-def test_create_transaction_invalid_inputs(bank_system, date, account, txn_type, amount, expected_message):
-    success, message = bank_system.create_transaction(date, account, txn_type, amount)
+], ids=["bad_date", "non_ascii_date", "bad_type", "neg_amount", "nan_amount"])
+def test_create_transaction_invalid_inputs(readonly_bank_system, date, account, txn_type, amount, expected_message):
+    success, message = readonly_bank_system.create_transaction(date, account, txn_type, amount)
     assert success is False
     assert expected_message in message
+    assert readonly_bank_system.accounts == {}  # Rejected input must not create state
+
+def test_load_transactions(bank_system):
+    results = bank_system.load_transactions([
+        "20230101 ACC001 D 1000.00\n",
+        "\n",  # Blank lines are skipped
+        "20230102 ACC001 W 200.00\n",
+        "20230103 ACC001 D\n",  # Missing amount
+        "20230104 ACC001 W 5000.00\n",
+    ])
+    
+    assert results == [
+        (True, "ACC001"),
+        (True, "ACC001"),
+        (False, "Invalid input format."),
+        (False, "Insufficient funds for withdrawal."),
+    ]
+    assert bank_system.accounts["ACC001"].get_balance_at_date(d(2023, 1, 31)) == D_800
 
 def test_add_interest_rule(bank_system):
     success, message = bank_system.add_interest_rule("20230101", "RULE1", "5.25")
@@ -145,120 +270,141 @@ def test_add_interest_rule(bank_system):
     assert success is True
     assert len(bank_system.interest_rules) == 1
     assert bank_system.interest_rules[0].rule_id == "RULE1"
-    assert bank_system.interest_rules[0].rate == Decimal("5.25")
+    assert bank_system.interest_rules[0].rate == D_5_25
+
+def test_add_interest_rule_keeps_rules_sorted(bank_system):
+    bank_system.add_interest_rule("20230301", "RULE3", "3.00")
+    bank_system.add_interest_rule("20230101", "RULE1", "1.00")
+    bank_system.add_interest_rule("20230201", "RULE2", "2.00")
+    
+    # A rule on an existing date replaces the old one
+    bank_system.add_interest_rule("20230201", "RULE4", "4.00")
+    
+    assert [rule.rule_id for rule in bank_system.interest_rules] == ["RULE1", "RULE4", "RULE3"]
+    assert bank_system.interest_rules[1].rate == D_4
+    
+    # The rules are exposed read-only so the date index cannot go stale
+    with pytest.raises(AttributeError):
+        bank_system.interest_rules.clear()
 
 @pytest.mark.parametrize("date, rule_id, rate, expected_message", [
     ("2023-01-01", "RULE1", "5.25", "Invalid date format"),
     ("20230101", "RULE1", "-5.25", "Interest rate must be greater than 0"),
     ("20230101", "RULE1", "105.25", "Interest rate must be greater than 0 and less than 100"),
     ("20230101", "RULE1", "abc", "Invalid rate format"),
-])
-def test_add_interest_rule_invalid_inputs(bank_system, date, rule_id, rate, expected_message):
-    success, message = bank_system.add_interest_rule(date, rule_id, rate)
+], ids=["bad_date", "neg_rate", "rate_too_high", "nan_rate"])
+def test_add_interest_rule_invalid_inputs(readonly_bank_system, date, rule_id, rate, expected_message):
+    success, message = readonly_bank_system.add_interest_rule(date, rule_id, rate)
     assert success is False
     assert expected_message in message
+    assert readonly_bank_system.interest_rules == ()  # Rejected input must not create state
 
-def test_calculate_interest_simple_case(bank_system):
-    # Add an interest rule
+@pytest.fixture
+def bs_with_rule1(bank_system):
+    # The 5% rule from 20230101 that most interest tests start from
     bank_system.add_interest_rule("20230101", "RULE1", "5.00")
-    
-    # Add a transaction
-    bank_system.create_transaction("20230101", "ACC001", "D", "1000.00")
-    
-    # Calculate interest for January 2023
-    interest = bank_system.calculate_interest("ACC001", 2023, 1)
-    
-    # 5% annual interest on $1000 for 31 days = $1000 * 0.05 * 31/365 = $4.25
-    assert interest == Decimal("4.25")
-    
-    # Check that an interest transaction was added
-    account = bank_system.accounts["ACC001"]
-    assert len(account.transactions) == 2
-    assert account.transactions[1].transaction_type == "I"
-    assert account.transactions[1].amount == Decimal("4.25")
-    assert account.transactions[1].date == datetime(2023, 1, 31).date()
+    return bank_system
 
-def test_calculate_interest_multiple_transactions(bank_system):
-    # Add an interest rule
-    bank_system.add_interest_rule("20230101", "RULE1", "5.00")
-    
-    # Add transactions
-    bank_system.create_transaction("20230101", "ACC001", "D", "1000.00")
-    bank_system.create_transaction("20230115", "ACC001", "D", "500.00")
-    bank_system.create_transaction("20230120", "ACC001", "W", "200.00")
-    
-    # Calculate interest for January 2023
-    interest = bank_system.calculate_interest("ACC001", 2023, 1)
-    
-    # Expected interest calculation:
+# Each case: interest rules on top of RULE1, transactions, then the months to
+# calculate in order with the interest expected for each
+INTEREST_CASES = [
+    # 5% annual interest on $1000 for 31 days = $1000 * 0.05 * 31/365 = $4.25
+    (
+        [],
+        [("20230101", "ACC001", "D", "1000.00")],
+        [(2023, 1, D_4_25)],
+    ),
     # $1000 for 14 days at 5% = $1000 * 0.05 * 14/365 = $1.92
     # $1500 for 5 days at 5% = $1500 * 0.05 * 5/365 = $1.03
     # $1300 for 12 days at 5% = $1300 * 0.05 * 12/365 = $2.13
     # Total = $5.08 (due to rounding)
-    assert interest == Decimal("5.08")
-
-def test_calculate_interest_changing_rules(bank_system):
-    # Add two interest rules
-    bank_system.add_interest_rule("20230101", "RULE1", "5.00")
-    bank_system.add_interest_rule("20230115", "RULE2", "6.00")
-    
-    # Add a transaction
-    bank_system.create_transaction("20230101", "ACC001", "D", "1000.00")
-    
-    # Calculate interest for January 2023
-    interest = bank_system.calculate_interest("ACC001", 2023, 1)
-    
-    # Expected interest calculation:
+    (
+        [],
+        [
+            ("20230101", "ACC001", "D", "1000.00"),
+            ("20230115", "ACC001", "D", "500.00"),
+            ("20230120", "ACC001", "W", "200.00"),
+        ],
+        [(2023, 1, D_5_08)],
+    ),
     # $1000 for 14 days at 5% = $1000 * 0.05 * 14/365 = $1.92
     # $1000 for 17 days at 6% = $1000 * 0.06 * 17/365 = $2.79
     # Total = $4.71
-    assert interest == Decimal("4.71")
+    (
+        [("20230115", "RULE2", "6.00")],
+        [("20230101", "ACC001", "D", "1000.00")],
+        [(2023, 1, D_4_71)],
+    ),
+    # January as in the simple case, then the balance in February is
+    # $1000 + $4.25 = $1004.25
+    # 5% annual interest on $1004.25 for 28 days = $1004.25 * 0.05 * 28/365 = $3.85
+    pytest.param(
+        [],
+        [("20230101", "ACC001", "D", "1000.00")],
+        [(2023, 1, D_4_25), (2023, 2, D_3_85)],
+        marks=pytest.mark.slow,
+    ),
+]
 
-def test_calculate_interest_no_balance(bank_system):
-    # Add an interest rule
-    bank_system.add_interest_rule("20230101", "RULE1", "5.00")
+@pytest.mark.parametrize("extra_rules, txns, months", INTEREST_CASES,
+                         ids=["simple", "multiple_transactions", "changing_rules", "multiple_months"])
+def test_calculate_interest(bs_with_rule1, extra_rules, txns, months):
+    _bulk(bs_with_rule1, txns, extra_rules)
+    
+    account = bs_with_rule1.accounts["ACC001"]
+    for year, month, expected in months:
+        interest = bs_with_rule1.calculate_interest("ACC001", year, month)
+        assert interest == expected
+        
+        # Check that an interest transaction was added on the last day of the month
+        interest_txn = account.transactions[-1]
+        assert interest_txn.transaction_type == "I"
+        assert interest_txn.amount == expected
+        assert interest_txn.date == d(year, month, calendar.monthrange(year, month)[1])
     
+    assert len(account.transactions) == len(txns) + len(months)
+
+def test_calculate_interest_no_balance(bs_with_rule1):
     # Account with no transactions
-    interest = bank_system.calculate_interest("ACC001", 2023, 1)
+    interest = bs_with_rule1.calculate_interest("ACC001", 2023, 1)
     assert interest is None
     
     # Account with zero balance
-    bank_system.create_transaction("20230101", "ACC002", "D", "500.00")
-    bank_system.create_transaction("20230101", "ACC002", "W", "500.00")
-    interest = bank_system.calculate_interest("ACC002", 2023, 1)
-    assert interest == Decimal("0")
+    _bulk(bs_with_rule1, [
+        ("20230101", "ACC002", "D", "500.00"),
+        ("20230101", "ACC002", "W", "500.00"),
+    ])
+    interest = bs_with_rule1.calculate_interest("ACC002", 2023, 1)
+    assert interest == D_0
 
-def test_calculate_interest_multiple_months(bank_system):
-    # Add an interest rule
-    bank_system.add_interest_rule("20230101", "RULE1", "5.00")
-    
-    # Add a transaction
-    bank_system.create_transaction("20230101", "ACC001", "D", "1000.00")
-    
-    # Calculate interest for January 2023
-    jan_interest = bank_system.calculate_interest("ACC001", 2023, 1)
-    assert jan_interest == Decimal("4.25")
-    
-    # Calculate interest for February 2023
-    feb_interest = bank_system.calculate_interest("ACC001", 2023, 2)
-    # Expected balance in February: $1000 + $4.25 = $1004.25
-    # 5% annual interest on $1004.25 for 28 days = $1004.25 * 0.05 * 28/365 = $3.85
-    assert feb_interest == Decimal("3.85")
+def test_calculate_interest_after_account_replaced(bs_with_rule1):
+    _bulk(bs_with_rule1, [("20230101", "ACC001", "D", "1000.00")])
+    assert bs_with_rule1.calculate_interest("ACC001", 2023, 1) == D_4_25
+    
+    # A fresh account under the same ID has no interest posted yet
+    bs_with_rule1.accounts["ACC001"] = BankAccount("ACC001")
+    _bulk(bs_with_rule1, [("20230101", "ACC001", "D", "1000.00")])
+    assert bs_with_rule1.calculate_interest("ACC001", 2023, 1) == D_4_25
+
+def test_sweep_interest():
+    # Balance of 1000.00 at 5% for 31 days, nothing changes during the period
+    assert sweep_interest([], [], [], [], 1, 31, 100000, 500) == 100000 * 500 * 31
+    
+    # Deposit on day 15 and a rate change on day 20; a change on the
+    # last day does not accrue that day
+    total = sweep_interest([15, 31], [150000, 200000], [20], [600], 1, 31, 100000, 500)
+    assert total == 100000 * 500 * 14 + 150000 * 500 * 5 + 150000 * 600 * 11
 
 def test_print_account_transactions(bank_system):
     # Add transactions
-    bank_system.create_transaction("20230101", "ACC001", "D", "1000.00")
-    bank_system.create_transaction("20230115", "ACC001", "W", "200.00")
+    _bulk(bank_system, [
+        ("20230101", "ACC001", "D", "1000.00"),
+        ("20230115", "ACC001", "W", "200.00"),
+    ])
     
     # Print transactions without balance
     output = bank_system.print_account_transactions("ACC001")
-    assert "ACC001" in output
-    assert "20230101" in output
-    assert "D" in output
-    assert "1000.00" in output
-    assert "20230115" in output
-    assert "W" in output
-    assert "200.00" in output
+    assert not missing_tokens(TRANSACTION_TOKENS, output)
     
     # Print transactions with balance
     output = bank_system.print_account_transactions("ACC001", with_balance=True)
@@ -269,33 +415,26 @@ def test_print_account_transactions(bank_system):
     output = bank_system.print_account_transactions("NON_EXISTENT")
     assert "does not exist" in output
 
-def test_print_monthly_statement(bank_system):
-    # Add an interest rule
-    bank_system.add_interest_rule("20230101", "RULE1", "5.00")
-    
+def test_print_monthly_statement(bs_with_rule1):
     # Add transactions
-    bank_system.create_transaction("20230101", "ACC001", "D", "1000.00")
-    bank_system.create_transaction("20230115", "ACC001", "W", "200.00")
+    _bulk(bs_with_rule1, [
+        ("20230101", "ACC001", "D", "1000.00"),
+        ("20230115", "ACC001", "W", "200.00"),
+    ])
     
     # Print statement
-    output = bank_system.print_monthly_statement("ACC001", "202301")
-    assert "ACC001" in output
-    assert "20230101" in output
-    assert "D" in output
-    assert "1000.00" in output
-    assert "20230115" in output
-    assert "W" in output
-    assert "200.00" in output
-    assert "I" in output  # Interest transaction should be included
+    output = bs_with_rule1.print_monthly_statement("ACC001", "202301")
+    assert not missing_tokens(TRANSACTION_TOKENS, output)
+    assert INTEREST_ROW in output  # Interest transaction should be included
     
     # Print statement for non-existent account
-    output = bank_system.print_monthly_statement("NON_EXISTENT", "202301")
+    output = bs_with_rule1.print_monthly_statement("NON_EXISTENT", "202301")
     assert "does not exist" in output
     
     # Print statement with invalid month format
     # Looking at the actual implementation, it seems the bank_system handles
     # this format differently than expected and processes it as January 2023
-    output = bank_system.print_monthly_statement("ACC001", "20231")
+    output = bs_with_rule1.print_monthly_statement("ACC001", "20231")
     assert "20230101" in output
     assert "20230115" in output
 
@@ -305,64 +444,71 @@ def test_print_interest_rules(bank_system):
     assert "No interest rules" in output
     
     # Add rules
-    bank_system.add_interest_rule("20230101", "RULE1", "5.00")
-    bank_system.add_interest_rule("20230201", "RULE2", "5.50")
+    _bulk(bank_system, [], [
+        ("20230101", "RULE1", "5.00"),
+        ("20230201", "RULE2", "5.50"),
+    ])
     
     # Print rules
     output = bank_system.print_interest_rules()
-    assert "Interest rules" in output
-    assert "RULE1" in output
-    assert "RULE2" in output
-    assert "5.00" in output
-    assert "5.50" in output
+    assert not missing_tokens(RULE_TOKENS, output)
 
 # ------------------- Integration Tests -------------------
-def test_full_month_scenario(bank_system):
-    # Add an interest rule
-    bank_system.add_interest_rule("20230101", "RULE1", "5.00")
-    
-    # Add transactions throughout January
-    bank_system.create_transaction("20230101", "ACC001", "D", "1000.00")
-    bank_system.create_transaction("20230110", "ACC001", "D", "500.00")
-    bank_system.create_transaction("20230115", "ACC001", "W", "200.00")
-    bank_system.create_transaction("20230120", "ACC001", "D", "300.00")
+@pytest.fixture(scope="module")
+def january_state():
+    bank = BankSystem()
+    
+    # Add an interest rule and transactions throughout January
+    _bulk(bank, [
+        ("20230101", "ACC001", "D", "1000.00"),
+        ("20230110", "ACC001", "D", "500.00"),
+        ("20230115", "ACC001", "W", "200.00"),
+        ("20230120", "ACC001", "D", "300.00"),
+    ], [("20230101", "RULE1", "5.00")])
     
     # Calculate interest for January 2023
-    interest = bank_system.calculate_interest("ACC001", 2023, 1)
+    interest = bank.calculate_interest("ACC001", 2023, 1)
+    return bank, interest
+
+@pytest.mark.slow
+def test_january_statement(january_state):
+    bank, interest = january_state
     
     # Print January statement
-    january_statement = bank_system.print_monthly_statement("ACC001", "202301")
+    january_statement = bank.print_monthly_statement("ACC001", "202301")
     
     # Verify the statement includes all transactions and interest
-    assert "20230101" in january_statement
-    assert "20230110" in january_statement
-    assert "20230115" in january_statement
-    assert "20230120" in january_statement
-    assert "20230131" in january_statement  # Interest date
+    assert not missing_tokens(JANUARY_TOKENS, january_statement)
     
     # Verify the final balance includes interest
-    expected_balance = Decimal("1000.00") + Decimal("500.00") - Decimal("200.00") + Decimal("300.00") + interest
+    expected_balance = D_1000 + D_500 - D_200 + D_300 + interest
     assert f"{expected_balance:.2f}" in january_statement
 
+@pytest.mark.slow
+def test_february_continuation(january_state):
+    # Continue from a copy so the shared January state stays untouched
+    bank = copy.deepcopy(january_state[0])
+    
     # Now continue to February
-    bank_system.create_transaction("20230205", "ACC001", "W", "400.00")
-    bank_system.create_transaction("20230220", "ACC001", "D", "1000.00")
+    _bulk(bank, [
+        ("20230205", "ACC001", "W", "400.00"),
+        ("20230220", "ACC001", "D", "1000.00"),
+    ])
     
     # Calculate interest for February 2023
-    feb_interest = bank_system.calculate_interest("ACC001", 2023, 2)
+    feb_interest = bank.calculate_interest("ACC001", 2023, 2)
     
     # Print February statement
-    february_statement = bank_system.print_monthly_statement("ACC001", "202302")
+    february_statement = bank.print_monthly_statement("ACC001", "202302")
     
-    # Verify February statement
-    assert "20230205" in february_statement
-    assert "20230220" in february_statement
-    assert "20230228" in february_statement  # February interest date
+    # Verify February statement, including the interest date
+    assert not missing_tokens(FEBRUARY_TOKENS, february_statement)
 
 # ------------------- Main Function Test -------------------
-def test_main_function():
+@pytest.fixture
+def main_inputs():
     # Define the input sequence
-    inputs = [
+    return iter([
         'T',  # Choose Transaction
         '20230101 ACC001 D 1000.00',  # Add a deposit
         '',  # Go back to menu
@@ -373,19 +519,32 @@ def test_main_function():
         'ACC001 202301',  # Print January statement for ACC001
         '',  # Go back to menu
         'Q'   # Quit
-    ]
+    ])
+
+class _Sink:
+    """Minimal stdout replacement that collects writes in a list"""
+    def __init__(self):
+        self.parts = []
     
-    # Patch the input and output
-    with patch('builtins.input', side_effect=inputs), \
-         patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
-        
-        import bank_system
-        bank_system.main()
-        
-        output = mock_stdout.getvalue()
-        
-        # Check that various expected outputs appear
-        assert "Welcome to AwesomeGIC Bank" in output
-        assert "Account: ACC001" in output
-        assert "Interest rules" in output
-        assert "Thank you for banking with AwesomeGIC Bank" in output
\ No newline at end of file
+    def write(self, s):
+        self.parts.append(s)
+        return len(s)
+    
+    def flush(self):
+        pass
+
+def test_main_function(main_inputs, monkeypatch):
+    # Feed the scripted input and collect everything printed
+    sink = _Sink()
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(main_inputs))
+    monkeypatch.setattr(sys, "stdout", sink)
+    
+    bank_system_module.main()
+    
+    output = "".join(sink.parts)
+    
+    # Check that various expected outputs appear
+    assert "Welcome to AwesomeGIC Bank" in output
+    assert "Account: ACC001" in output
+    assert "Interest rules" in output
+    assert "Thank you for banking with AwesomeGIC Bank" in output
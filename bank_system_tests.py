@@ -1,104 +1,248 @@
-import unittest
+import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
 import sys
-import io
-from unittest.mock import patch
+import builtins
+import copy
+from unittest import mock
 
 # Import the bank system module
-from bank_system import Transaction, InterestRule, BankAccount, BankSystem
+from bank_system import Transaction, InterestRule, BankAccount, BankSystem, sweep_interest
 
-class TestTransaction(unittest.TestCase):
+# Decimal constants shared by the assertions below
+D_0 = Decimal("0")
+D_3_85 = Decimal("3.85")
+D_4 = Decimal("4.00")
+D_4_25 = Decimal("4.25")
+D_4_71 = Decimal("4.71")
+D_5_08 = Decimal("5.08")
+D_5_13 = Decimal("5.13")
+D_5_25 = Decimal("5.25")
+D_100 = Decimal("100.00")
+D_100_46 = Decimal("100.46")
+D_200 = Decimal("200.00")
+D_300 = Decimal("300.00")
+D_305 = Decimal("305.00")
+D_400 = Decimal("400.00")
+D_450 = Decimal("450.00")
+D_500 = Decimal("500.00")
+D_600 = Decimal("600.00")
+D_800 = Decimal("800.00")
+D_1000 = Decimal("1000.00")
+
+# Date constants; dates are immutable, so every test can share them
+JAN1 = datetime(2023, 1, 1).date()
+JAN10 = datetime(2023, 1, 10).date()
+JAN15 = datetime(2023, 1, 15).date()
+JAN31 = datetime(2023, 1, 31).date()
+FEB1 = datetime(2023, 2, 1).date()
+
+# Words that must appear, whitespace-separated, in an output; checked with
+# WORDS - set(output.split()) so the output is split once per check
+TRANSACTION_WORDS = frozenset(("ACC001", "20230101", "D", "1000.00", "20230115", "W", "200.00"))
+RULE_WORDS = frozenset(("RULE1", "RULE2", "5.00", "5.50"))
+# Transaction dates plus the interest date at the end of each month
+JANUARY_WORDS = frozenset(("20230101", "20230110", "20230115", "20230120", "20230131"))
+FEBRUARY_WORDS = frozenset(("20230205", "20230220", "20230228"))
+
+@pytest.fixture
+def bank():
+    return BankSystem()
+
+@pytest.fixture(scope="class")
+def shared_bank():
+    # Only handed to tests that never mutate the bank
+    return BankSystem()
+
+@pytest.fixture
+def account():
+    return BankAccount("ACC001")
+
+@pytest.fixture(scope="session")
+def _prebuilt_january_bank():
+    bank = BankSystem()
+    bank.add_interest_rule("20230101", "RULE1", "5.00")
+    bank.create_transaction("20230101", "ACC001", "D", "1000.00")
+    bank.create_transaction("20230110", "ACC001", "D", "500.00")
+    bank.create_transaction("20230115", "ACC001", "W", "200.00")
+    bank.create_transaction("20230120", "ACC001", "D", "300.00")
+    return bank
+
+@pytest.fixture
+def january_bank(_prebuilt_january_bank):
+    # Tests mutate the bank, so each one gets its own copy of the January state
+    return copy.deepcopy(_prebuilt_january_bank)
+
+@pytest.fixture(scope="session")
+def _rule_plus_deposit():
+    bank = BankSystem()
+    bank.add_interest_rule("20230101", "RULE1", "5.00")
+    bank.create_transaction("20230101", "ACC001", "D", "1000.00")
+    return bank
+
+@pytest.fixture
+def rule_plus_deposit_bank(_rule_plus_deposit):
+    return copy.deepcopy(_rule_plus_deposit)
+
+class TestTransaction:
     def test_transaction_initialization(self):
-        date = datetime(2023, 1, 15).date()
+        date = JAN15
         txn = Transaction(date, "ACC001", "d", "100.456")
         
-        self.assertEqual(txn.date, date)
-        self.assertEqual(txn.account, "ACC001")
-        self.assertEqual(txn.transaction_type, "D")  # Should be uppercase
-        self.assertEqual(txn.amount, Decimal("100.46"))  # Should round to 2 decimal places
-        self.assertIsNone(txn.txn_id)  # ID should be None if not provided
+        assert txn.date == date
+        assert txn.account == "ACC001"
+        assert txn.transaction_type == "D"  # Should be uppercase
+        assert txn.amount == D_100_46  # Should round to 2 decimal places
+        assert txn.txn_id is None  # ID should be None if not provided
 
     def test_transaction_with_id(self):
-        date = datetime(2023, 1, 15).date()
+        date = JAN15
         txn = Transaction(date, "ACC001", "W", "50.00", "20230115-01")
         
-        self.assertEqual(txn.txn_id, "20230115-01")
-        self.assertEqual(txn.transaction_type, "W")
+        assert txn.txn_id == "20230115-01"
+        assert txn.transaction_type == "W"
+        assert txn.signed_cents == -5000  # Withdrawals reduce the balance
 
-class TestInterestRule(unittest.TestCase):
+class TestInterestRule:
     def test_interest_rule_initialization(self):
-        date = datetime(2023, 1, 1).date()
+        date = JAN1
         rule = InterestRule(date, "RULE1", "5.125")
         
-        self.assertEqual(rule.date, date)
-        self.assertEqual(rule.rule_id, "RULE1")
-        self.assertEqual(rule.rate, Decimal("5.13"))  # Should round to 2 decimal places
+        assert rule.date == date
+        assert rule.rule_id == "RULE1"
+        assert rule.rate == D_5_13  # Should round to 2 decimal places
 
-class TestBankAccount(unittest.TestCase):
-    def setUp(self):
-        self.account = BankAccount("ACC001")
-        self.date1 = datetime(2023, 1, 1).date()
-        self.date2 = datetime(2023, 1, 15).date()
-        self.date3 = datetime(2023, 1, 31).date()
+class TestBankAccount:
+    @pytest.fixture(autouse=True)
+    def _setup(self, account):
+        self.account = account
 
     def test_add_transaction(self):
-        txn = Transaction(self.date1, "ACC001", "D", "100.00")
+        txn = Transaction(JAN1, "ACC001", "D", "100.00")
         self.account.add_transaction(txn)
         
-        self.assertEqual(len(self.account.transactions), 1)
-        self.assertEqual(self.account.transactions[0], txn)
-
-    def test_get_balance_at_date_with_deposits_only(self):
-        self.account.add_transaction(Transaction(self.date1, "ACC001", "D", "100.00"))
-        self.account.add_transaction(Transaction(self.date2, "ACC001", "D", "200.00"))
+        txns = self.account.transactions
+        assert len(txns) == 1
+        assert txns[0] == txn
         
-        # Check balance at different dates
-        self.assertEqual(self.account.get_balance_at_date(self.date1), Decimal("100.00"))
-        self.assertEqual(self.account.get_balance_at_date(self.date2), Decimal("300.00"))
-        # Date in-between transactions
-        in_between = datetime(2023, 1, 10).date()
-        self.assertEqual(self.account.get_balance_at_date(in_between), Decimal("100.00"))
-        # Date after all transactions
-        after = datetime(2023, 2, 1).date()
-        self.assertEqual(self.account.get_balance_at_date(after), Decimal("300.00"))
+        # Both views are read-only so the sorted index cannot go stale
+        with pytest.raises(AttributeError):
+            txns.clear()
+        with pytest.raises(AttributeError):
+            self.account.get_sorted_transactions().clear()
 
     def test_get_balance_at_date_with_mixed_transactions(self):
-        self.account.add_transaction(Transaction(self.date1, "ACC001", "D", "500.00"))
-        self.account.add_transaction(Transaction(self.date2, "ACC001", "W", "200.00"))
-        self.account.add_transaction(Transaction(self.date3, "ACC001", "I", "5.00"))
-        
-        self.assertEqual(self.account.get_balance_at_date(self.date1), Decimal("500.00"))
-        self.assertEqual(self.account.get_balance_at_date(self.date2), Decimal("300.00"))
-        self.assertEqual(self.account.get_balance_at_date(self.date3), Decimal("305.00"))
+        self.account.add_transactions([
+            Transaction(JAN1, "ACC001", "D", "500.00"),
+            Transaction(JAN15, "ACC001", "W", "200.00"),
+            Transaction(JAN31, "ACC001", "I", "5.00"),
+        ])
+        
+        assert self.account.get_balance_at_date(JAN1) == D_500
+        assert self.account.get_balance_at_date(JAN15) == D_300
+        assert self.account.get_balance_at_date(JAN31) == D_305
+
+    def test_get_balance_at_date_with_backdated_transaction(self):
+        self.account.add_transaction(Transaction(JAN31, "ACC001", "D", "100.00"))
+        self.account.add_transaction(Transaction(JAN1, "ACC001", "D", "500.00"))
+        self.account.add_transaction(Transaction(JAN15, "ACC001", "W", "200.00"))
+        
+        # Later balances must reflect transactions inserted before them
+        assert self.account.get_balance_at_date(JAN1) == D_500
+        assert self.account.get_balance_at_date(JAN15) == D_300
+        assert self.account.get_balance_at_date(JAN31) == D_400
+
+    def test_add_transactions_matches_add_transaction(self):
+        # Out of date order, with two transactions sharing a date
+        txns = [
+            Transaction(JAN31, "ACC001", "D", "100.00", "20230131-01"),
+            Transaction(JAN1, "ACC001", "D", "500.00", "20230101-02"),
+            Transaction(JAN1, "ACC001", "D", "50.00", "20230101-01"),
+            Transaction(JAN15, "ACC001", "W", "200.00", "20230115-01"),
+        ]
+        one_by_one = BankAccount("ACC001")
+        for txn in txns:
+            one_by_one.add_transaction(txn)
+        
+        self.account.add_transactions(iter(txns))
+        
+        assert self.account.transactions == tuple(txns)
+        assert self.account.get_sorted_transactions() == one_by_one.get_sorted_transactions()
+        for day in (JAN1, JAN15, JAN31):
+            assert self.account.get_balance_at_date(day) == one_by_one.get_balance_at_date(day)
+        assert self.account.get_balance_at_date(JAN31) == D_450
 
     def test_can_withdraw(self):
-        self.account.add_transaction(Transaction(self.date1, "ACC001", "D", "500.00"))
+        self.account.add_transaction(Transaction(JAN1, "ACC001", "D", "500.00"))
         
         # Check if withdrawals are possible
-        self.assertTrue(self.account.can_withdraw(Decimal("500.00"), self.date1))
-        self.assertTrue(self.account.can_withdraw(Decimal("300.00"), self.date1))
-        self.assertFalse(self.account.can_withdraw(Decimal("600.00"), self.date1))
+        assert self.account.can_withdraw(D_500, JAN1)
+        assert self.account.can_withdraw(D_300, JAN1)
+        assert not self.account.can_withdraw(D_600, JAN1)
+        # The amount is not rounded before the comparison
+        assert not self.account.can_withdraw(Decimal("500.004"), JAN1)
         
         # Add a withdrawal and check again
-        self.account.add_transaction(Transaction(self.date2, "ACC001", "W", "200.00"))
-        self.assertFalse(self.account.can_withdraw(Decimal("400.00"), self.date2))
-        self.assertTrue(self.account.can_withdraw(Decimal("300.00"), self.date2))
+        self.account.add_transaction(Transaction(JAN15, "ACC001", "W", "200.00"))
+        assert not self.account.can_withdraw(D_400, JAN15)
+        assert self.account.can_withdraw(D_300, JAN15)
+
+@pytest.fixture(scope="module")
+def two_deposit_account():
+    # Only read by the probes below, so it is built once for the module
+    account = BankAccount("ACC001")
+    account.add_transactions([
+        Transaction(JAN1, "ACC001", "D", "100.00"),
+        Transaction(JAN15, "ACC001", "D", "200.00"),
+    ])
+    return account
+
+@pytest.mark.parametrize("probe,expected", [
+    (JAN1, D_100),
+    (JAN15, D_300),
+    (JAN10, D_100),  # Date in-between transactions
+    (FEB1, D_300),  # Date after all transactions
+], ids=["date1", "date2", "in_between", "after"])
+def test_get_balance_at_date_with_deposits_only(two_deposit_account, probe, expected):
+    assert two_deposit_account.get_balance_at_date(probe) == expected
 
-class TestBankSystem(unittest.TestCase):
-    def setUp(self):
-        self.bank = BankSystem()
+class TestBankSystemReadOnly:
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_bank):
+        self.bank = shared_bank
+
+    def test_calculate_interest_unknown_account(self):
+        assert self.bank.calculate_interest("ACC001", 2023, 1) is None
+
+    def test_print_account_transactions_non_existent(self):
+        output = self.bank.print_account_transactions("NON_EXISTENT")
+        assert "does not exist" in output
+
+    def test_print_monthly_statement_non_existent(self):
+        output = self.bank.print_monthly_statement("NON_EXISTENT", "202301")
+        assert "does not exist" in output
+
+    def test_print_interest_rules_empty(self):
+        output = self.bank.print_interest_rules()
+        assert "No interest rules" in output
+
+class TestBankSystemMutating:
+    @pytest.fixture(autouse=True)
+    def _setup(self, bank):
+        self.bank = bank
 
     def test_create_transaction_deposit(self):
         success, message = self.bank.create_transaction("20230101", "ACC001", "D", "100.00")
         
-        self.assertTrue(success)
-        self.assertEqual(message, "ACC001")  # Should return account ID
-        self.assertIn("ACC001", self.bank.accounts)
-        self.assertEqual(len(self.bank.accounts["ACC001"].transactions), 1)
-        self.assertEqual(self.bank.accounts["ACC001"].transactions[0].amount, Decimal("100.00"))
-        self.assertEqual(self.bank.accounts["ACC001"].transactions[0].transaction_type, "D")
-        self.assertEqual(self.bank.accounts["ACC001"].transactions[0].txn_id, "20230101-01")
+        assert success
+        assert message == "ACC001"  # Should return account ID
+        assert "ACC001" in self.bank.accounts
+        txns = self.bank.accounts["ACC001"].transactions
+        assert len(txns) == 1
+        txn = txns[0]
+        assert txn.amount == D_100
+        assert txn.transaction_type == "D"
+        assert txn.txn_id == "20230101-01"
 
     def test_create_transaction_withdrawal(self):
         # Create a deposit first
@@ -107,95 +251,152 @@ class TestBankSystem(unittest.TestCase):
         # Now try a withdrawal
         success, message = self.bank.create_transaction("20230102", "ACC001", "W", "200.00")
         
-        self.assertTrue(success)
-        self.assertEqual(len(self.bank.accounts["ACC001"].transactions), 2)
-        self.assertEqual(self.bank.accounts["ACC001"].transactions[1].amount, Decimal("200.00"))
-        self.assertEqual(self.bank.accounts["ACC001"].transactions[1].transaction_type, "W")
-        self.assertEqual(self.bank.accounts["ACC001"].transactions[1].txn_id, "20230102-01")
+        assert success
+        txns = self.bank.accounts["ACC001"].transactions
+        assert len(txns) == 2
+        txn = txns[1]
+        assert txn.amount == D_200
+        assert txn.transaction_type == "W"
+        assert txn.txn_id == "20230102-01"
 
     def test_create_transaction_insufficient_funds(self):
         # Try withdrawal without sufficient funds
         success, message = self.bank.create_transaction("20230101", "ACC001", "W", "100.00")
         
-        self.assertFalse(success)
-        self.assertEqual(message, "Insufficient funds for withdrawal.")
+        assert not success
+        assert message == "Insufficient funds for withdrawal."
+
+    def test_load_transactions(self):
+        results = self.bank.load_transactions([
+            "20230101 ACC001 D 1000.00\n",
+            "\n",  # Blank lines are skipped
+            "20230102 ACC001 W 200.00\n",
+            "20230103 ACC001 D\n",  # Missing amount
+            "20230104 ACC001 W 5000.00\n",
+        ])
+        
+        assert results == [
+            (True, "ACC001"),
+            (True, "ACC001"),
+            (False, "Invalid input format."),
+            (False, "Insufficient funds for withdrawal."),
+        ]
+        assert self.bank.accounts["ACC001"].get_balance_at_date(JAN31) == D_800
 
-    def test_create_transaction_invalid_inputs(self):
-        # Test invalid date
-        success, message = self.bank.create_transaction("2023-01-01", "ACC001", "D", "100.00")
-        self.assertFalse(success)
-        self.assertIn("Invalid date format", message)
+    def test_add_interest_rule(self):
+        success, message = self.bank.add_interest_rule("20230101", "RULE1", "5.25")
+        
+        assert success
+        assert len(self.bank.interest_rules) == 1
+        assert self.bank.interest_rules[0].rule_id == "RULE1"
+        assert self.bank.interest_rules[0].rate == D_5_25
+
+    def test_add_interest_rule_keeps_rules_sorted(self):
+        self.bank.add_interest_rule("20230301", "RULE3", "3.00")
+        self.bank.add_interest_rule("20230101", "RULE1", "1.00")
+        self.bank.add_interest_rule("20230201", "RULE2", "2.00")
         
-        # Test invalid transaction type
-        success, message = self.bank.create_transaction("20230101", "ACC001", "X", "100.00")
-        self.assertFalse(success)
-        self.assertIn("Invalid transaction type", message)
+        # A rule on an existing date replaces the old one
+        self.bank.add_interest_rule("20230201", "RULE4", "4.00")
         
-        # Test invalid amount
-        success, message = self.bank.create_transaction("20230101", "ACC001", "D", "-100.00")
-        self.assertFalse(success)
-        self.assertIn("Amount must be greater than zero", message)
+        assert [rule.rule_id for rule in self.bank.interest_rules] == ["RULE1", "RULE4", "RULE3"]
+        assert self.bank.interest_rules[1].rate == D_4
         
-        # Test non-numeric amount
-        success, message = self.bank.create_transaction("20230101", "ACC001", "D", "abc")
-        self.assertFalse(success)
-        self.assertIn("Invalid amount format", message)
+        # The rules are exposed read-only so the date index cannot go stale
+        with pytest.raises(AttributeError):
+            self.bank.interest_rules.clear()
 
-    def test_add_interest_rule(self):
-        success, message = self.bank.add_interest_rule("20230101", "RULE1", "5.25")
+    def test_calculate_interest_no_balance(self):
+        # Add an interest rule
+        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
         
-        self.assertTrue(success)
-        self.assertEqual(len(self.bank.interest_rules), 1)
-        self.assertEqual(self.bank.interest_rules[0].rule_id, "RULE1")
-        self.assertEqual(self.bank.interest_rules[0].rate, Decimal("5.25"))
+        # Account with zero balance
+        self.bank.create_transaction("20230101", "ACC002", "D", "500.00")
+        self.bank.create_transaction("20230101", "ACC002", "W", "500.00")
+        interest = self.bank.calculate_interest("ACC002", 2023, 1)
+        assert interest == D_0
 
-    def test_add_interest_rule_invalid_inputs(self):
-        # Test invalid date
-        success, message = self.bank.add_interest_rule("2023-01-01", "RULE1", "5.25")
-        self.assertFalse(success)
-        self.assertIn("Invalid date format", message)
+    def test_calculate_interest_after_account_replaced(self):
+        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
+        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
+        assert self.bank.calculate_interest("ACC001", 2023, 1) == D_4_25
         
-        # Test invalid rate (negative)
-        success, message = self.bank.add_interest_rule("20230101", "RULE1", "-5.25")
-        self.assertFalse(success)
-        self.assertIn("Interest rate must be greater than 0", message)
+        # A fresh account under the same ID has no interest posted yet
+        self.bank.accounts["ACC001"] = BankAccount("ACC001")
+        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
+        assert self.bank.calculate_interest("ACC001", 2023, 1) == D_4_25
+
+    def test_print_account_transactions(self):
+        # Add transactions
+        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
+        self.bank.create_transaction("20230115", "ACC001", "W", "200.00")
         
-        # Test invalid rate (too high)
-        success, message = self.bank.add_interest_rule("20230101", "RULE1", "105.25")
-        self.assertFalse(success)
-        self.assertIn("Interest rate must be greater than 0 and less than 100", message)
+        # Print transactions without balance
+        output = self.bank.print_account_transactions("ACC001")
+        assert TRANSACTION_WORDS - set(output.split()) == set()
         
-        # Test non-numeric rate
-        success, message = self.bank.add_interest_rule("20230101", "RULE1", "abc")
-        self.assertFalse(success)
-        self.assertIn("Invalid rate format", message)
+        # Print transactions with balance
+        output = self.bank.print_account_transactions("ACC001", with_balance=True)
+        assert "Balance" in output
+        assert "800.00" in output  # Final balance
 
-    def test_calculate_interest_simple_case(self):
+    def test_print_monthly_statement(self):
         # Add an interest rule
         self.bank.add_interest_rule("20230101", "RULE1", "5.00")
         
-        # Add a transaction
+        # Add transactions
         self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
+        self.bank.create_transaction("20230115", "ACC001", "W", "200.00")
+        
+        # The interest engine is covered by the calculate_interest tests, so only
+        # check that the statement asks for the month's interest
+        with mock.patch.object(BankSystem, 'calculate_interest', return_value=D_0) as calculate_interest:
+            # Print statement
+            output = self.bank.print_monthly_statement("ACC001", "202301")
+            assert TRANSACTION_WORDS - set(output.split()) == set()
+            calculate_interest.assert_called_once_with("ACC001", 2023, 1)
+            
+            # Print statement with invalid month format
+            output = self.bank.print_monthly_statement("ACC001", "20231")
+            # Looking at the actual implementation, it seems the bank_system handles
+            # this format differently than expected and processes it as January 2023
+            # So we should verify it contains January data instead
+            assert "20230101" in output
+            assert "20230115" in output
+
+    def test_print_interest_rules(self):
+        # Add rules
+        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
+        self.bank.add_interest_rule("20230201", "RULE2", "5.50")
         
+        # Print rules
+        output = self.bank.print_interest_rules()
+        assert "Interest rules" in output
+        assert RULE_WORDS - set(output.split()) == set()
+
+class TestBankSystemInterest:
+    @pytest.fixture(autouse=True)
+    def _setup(self, rule_plus_deposit_bank):
+        # Starts from RULE1 at 5.00% and a 1000.00 deposit to ACC001 on 20230101
+        self.bank = rule_plus_deposit_bank
+
+    def test_calculate_interest_simple_case(self):
         # Calculate interest for January 2023
         interest = self.bank.calculate_interest("ACC001", 2023, 1)
         
         # 5% annual interest on $1000 for 31 days = $1000 * 0.05 * 31/365 = $4.25
-        self.assertEqual(interest, Decimal("4.25"))
+        assert interest == D_4_25
         
         # Check that an interest transaction was added
-        account = self.bank.accounts["ACC001"]
-        self.assertEqual(len(account.transactions), 2)
-        self.assertEqual(account.transactions[1].transaction_type, "I")
-        self.assertEqual(account.transactions[1].amount, Decimal("4.25"))
-        self.assertEqual(account.transactions[1].date, datetime(2023, 1, 31).date())
+        txns = self.bank.accounts["ACC001"].transactions
+        assert len(txns) == 2
+        interest_txn = txns[1]
+        assert interest_txn.transaction_type == "I"
+        assert interest_txn.amount == D_4_25
+        assert interest_txn.date == JAN31
 
     def test_calculate_interest_multiple_transactions(self):
-        # Add an interest rule
-        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
-        
         # Add transactions
-        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
         self.bank.create_transaction("20230115", "ACC001", "D", "500.00")
         self.bank.create_transaction("20230120", "ACC001", "W", "200.00")
         
@@ -207,16 +408,12 @@ class TestBankSystem(unittest.TestCase):
         # $1500 for 5 days at 5% = $1500 * 0.05 * 5/365 = $1.03
         # $1300 for 12 days at 5% = $1300 * 0.05 * 12/365 = $2.13
         # Total = $5.08 (due to rounding)
-        self.assertEqual(interest, Decimal("5.08"))
+        assert interest == D_5_08
 
     def test_calculate_interest_changing_rules(self):
-        # Add two interest rules
-        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
+        # Add a second interest rule
         self.bank.add_interest_rule("20230115", "RULE2", "6.00")
         
-        # Add a transaction
-        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
-        
         # Calculate interest for January 2023
         interest = self.bank.calculate_interest("ACC001", 2023, 1)
         
@@ -224,125 +421,62 @@ class TestBankSystem(unittest.TestCase):
         # $1000 for 14 days at 5% = $1000 * 0.05 * 14/365 = $1.92
         # $1000 for 17 days at 6% = $1000 * 0.06 * 17/365 = $2.79
         # Total = $4.71
-        self.assertEqual(interest, Decimal("4.71"))
-
-    def test_calculate_interest_no_balance(self):
-        # Add an interest rule
-        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
-        
-        # Account with no transactions
-        interest = self.bank.calculate_interest("ACC001", 2023, 1)
-        self.assertIsNone(interest)
-        
-        # Account with zero balance
-        self.bank.create_transaction("20230101", "ACC002", "D", "500.00")
-        self.bank.create_transaction("20230101", "ACC002", "W", "500.00")
-        interest = self.bank.calculate_interest("ACC002", 2023, 1)
-        self.assertEqual(interest, Decimal("0"))
+        assert interest == D_4_71
 
+    @pytest.mark.slow
     def test_calculate_interest_multiple_months(self):
-        # Add an interest rule
-        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
-        
-        # Add a transaction
-        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
-        
         # Calculate interest for January 2023
         jan_interest = self.bank.calculate_interest("ACC001", 2023, 1)
-        self.assertEqual(jan_interest, Decimal("4.25"))
+        assert jan_interest == D_4_25
         
         # Calculate interest for February 2023
         feb_interest = self.bank.calculate_interest("ACC001", 2023, 2)
         # Expected balance in February: $1000 + $4.25 = $1004.25
         # 5% annual interest on $1004.25 for 28 days = $1004.25 * 0.05 * 28/365 = $3.85
-        self.assertEqual(feb_interest, Decimal("3.85"))
+        assert feb_interest == D_3_85
 
-    def test_print_account_transactions(self):
-        # Add transactions
-        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
-        self.bank.create_transaction("20230115", "ACC001", "W", "200.00")
-        
-        # Print transactions without balance
-        output = self.bank.print_account_transactions("ACC001")
-        self.assertIn("ACC001", output)
-        self.assertIn("20230101", output)
-        self.assertIn("D", output)
-        self.assertIn("1000.00", output)
-        self.assertIn("20230115", output)
-        self.assertIn("W", output)
-        self.assertIn("200.00", output)
-        
-        # Print transactions with balance
-        output = self.bank.print_account_transactions("ACC001", with_balance=True)
-        self.assertIn("Balance", output)
-        self.assertIn("800.00", output)  # Final balance
-        
-        # Print non-existent account
-        output = self.bank.print_account_transactions("NON_EXISTENT")
-        self.assertIn("does not exist", output)
+def test_sweep_interest():
+    # Balance of 1000.00 at 5% for 31 days, nothing changes during the period
+    assert sweep_interest([], [], [], [], 1, 31, 100000, 500) == 100000 * 500 * 31
+    
+    # Deposit on day 15 and a rate change on day 20; a change on the
+    # last day does not accrue that day
+    total = sweep_interest([15, 31], [150000, 200000], [20], [600], 1, 31, 100000, 500)
+    assert total == 100000 * 500 * 14 + 150000 * 500 * 5 + 150000 * 600 * 11
 
-    def test_print_monthly_statement(self):
-        # Add an interest rule
-        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
-        
-        # Add transactions
-        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
-        self.bank.create_transaction("20230115", "ACC001", "W", "200.00")
-        
-        # Print statement
-        output = self.bank.print_monthly_statement("ACC001", "202301")
-        self.assertIn("ACC001", output)
-        self.assertIn("20230101", output)
-        self.assertIn("D", output)
-        self.assertIn("1000.00", output)
-        self.assertIn("20230115", output)
-        self.assertIn("W", output)
-        self.assertIn("200.00", output)
-        self.assertIn("I", output)  # Interest transaction should be included
-        
-        # Print statement for non-existent account
-        output = self.bank.print_monthly_statement("NON_EXISTENT", "202301")
-        self.assertIn("does not exist", output)
-        
-        # Print statement with invalid month format
-        output = self.bank.print_monthly_statement("ACC001", "20231")
-        # Looking at the actual implementation, it seems the bank_system handles
-        # this format differently than expected and processes it as January 2023
-        # So we should verify it contains January data instead
-        self.assertIn("20230101", output)
-        self.assertIn("20230115", output)
+@pytest.mark.parametrize("date_str,typ,amount,error", [
+    ("2023-01-01", "D", "100.00", "Invalid date format"),
+    ("\u0662\u0660\u0662\u0663\u0660\u0661\u0660\u0661", "D", "100.00", "Invalid date format"),  # Arabic-Indic digits
+    ("20230101", "X", "100.00", "Invalid transaction type"),
+    ("20230101", "D", "-100.00", "Amount must be greater than zero"),
+    ("20230101", "D", "abc", "Invalid amount format"),
+], ids=["date", "non_ascii_date", "type", "negative_amount", "non_numeric_amount"])
+def test_create_transaction_invalid_inputs(bank, date_str, typ, amount, error):
+    success, message = bank.create_transaction(date_str, "ACC001", typ, amount)
+    
+    assert not success
+    assert error in message
 
-    def test_print_interest_rules(self):
-        # No rules yet
-        output = self.bank.print_interest_rules()
-        self.assertIn("No interest rules", output)
-        
-        # Add rules
-        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
-        self.bank.add_interest_rule("20230201", "RULE2", "5.50")
-        
-        # Print rules
-        output = self.bank.print_interest_rules()
-        self.assertIn("Interest rules", output)
-        self.assertIn("RULE1", output)
-        self.assertIn("RULE2", output)
-        self.assertIn("5.00", output)
-        self.assertIn("5.50", output)
-
-class TestBankSystemIntegration(unittest.TestCase):
-    def setUp(self):
-        self.bank = BankSystem()
+@pytest.mark.parametrize("date_str,rate,error", [
+    ("2023-01-01", "5.25", "Invalid date format"),
+    ("20230101", "-5.25", "Interest rate must be greater than 0"),
+    ("20230101", "105.25", "Interest rate must be greater than 0 and less than 100"),
+    ("20230101", "abc", "Invalid rate format"),
+], ids=["date", "negative_rate", "rate_too_high", "non_numeric_rate"])
+def test_add_interest_rule_invalid_inputs(bank, date_str, rate, error):
+    success, message = bank.add_interest_rule(date_str, "RULE1", rate)
     
+    assert not success
+    assert error in message
+
+class TestBankSystemIntegration:
+    @pytest.fixture(autouse=True)
+    def _setup(self, january_bank):
+        # Starts from RULE1 at 5.00% and four January transactions
+        self.bank = january_bank
+    
+    @pytest.mark.slow
     def test_full_month_scenario(self):
-        # Add an interest rule
-        self.bank.add_interest_rule("20230101", "RULE1", "5.00")
-        
-        # Add transactions throughout January
-        self.bank.create_transaction("20230101", "ACC001", "D", "1000.00")
-        self.bank.create_transaction("20230110", "ACC001", "D", "500.00")
-        self.bank.create_transaction("20230115", "ACC001", "W", "200.00")
-        self.bank.create_transaction("20230120", "ACC001", "D", "300.00")
-        
         # Calculate interest for January 2023
         interest = self.bank.calculate_interest("ACC001", 2023, 1)
         
@@ -350,15 +484,11 @@ class TestBankSystemIntegration(unittest.TestCase):
         january_statement = self.bank.print_monthly_statement("ACC001", "202301")
         
         # Verify the statement includes all transactions and interest
-        self.assertIn("20230101", january_statement)
-        self.assertIn("20230110", january_statement)
-        self.assertIn("20230115", january_statement)
-        self.assertIn("20230120", january_statement)
-        self.assertIn("20230131", january_statement)  # Interest date
+        assert JANUARY_WORDS - set(january_statement.split()) == set()
         
         # Verify the final balance includes interest
-        expected_balance = Decimal("1000.00") + Decimal("500.00") - Decimal("200.00") + Decimal("300.00") + interest
-        self.assertIn(f"{expected_balance:.2f}", january_statement)
+        expected_balance = D_1000 + D_500 - D_200 + D_300 + interest
+        assert f"{expected_balance:.2f}" in january_statement
 
         # Now continue to February
         self.bank.create_transaction("20230205", "ACC001", "W", "400.00")
@@ -370,36 +500,38 @@ class TestBankSystemIntegration(unittest.TestCase):
         # Print February statement
         february_statement = self.bank.print_monthly_statement("ACC001", "202302")
         
-        # Verify February statement
-        self.assertIn("20230205", february_statement)
-        self.assertIn("20230220", february_statement)
-        self.assertIn("20230228", february_statement)  # February interest date
-
-class TestMainFunction(unittest.TestCase):
-    @patch('sys.stdout', new_callable=io.StringIO)
-    @patch('builtins.input', side_effect=[
-        'T',  # Choose Transaction
-        '20230101 ACC001 D 1000.00',  # Add a deposit
-        '',  # Go back to menu
-        'I',  # Choose Interest rule
-        '20230101 RULE1 5.00',  # Add interest rule
-        '',  # Go back to menu
-        'P',  # Choose Print statement
-        'ACC001 202301',  # Print January statement for ACC001
-        '',  # Go back to menu
-        'Q'   # Quit
-    ])
-    def test_main_function(self, mock_input, mock_stdout):
+        # Verify February statement, including the interest date
+        assert FEBRUARY_WORDS - set(february_statement.split()) == set()
+
+# Scripted answers to main()'s prompts, in order
+_MAIN_INPUTS = (
+    'T',  # Choose Transaction
+    '20230101 ACC001 D 1000.00',  # Add a deposit
+    '',  # Go back to menu
+    'I',  # Choose Interest rule
+    '20230101 RULE1 5.00',  # Add interest rule
+    '',  # Go back to menu
+    'P',  # Choose Print statement
+    'ACC001 202301',  # Print January statement for ACC001
+    '',  # Go back to menu
+    'Q'   # Quit
+)
+
+class TestMainFunction:
+    def test_main_function(self, monkeypatch, capsys):
         import bank_system
+        inputs = iter(_MAIN_INPUTS)
+        monkeypatch.setattr(builtins, "input", lambda prompt="": next(inputs))
+        
         bank_system.main()
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         
         # Check that various expected outputs appear
-        self.assertIn("Welcome to AwesomeGIC Bank", output)
-        self.assertIn("Account: ACC001", output)
-        self.assertIn("Interest rules", output)
-        self.assertIn("Thank you for banking with AwesomeGIC Bank", output)
+        assert "Welcome to AwesomeGIC Bank" in output
+        assert "Account: ACC001" in output
+        assert "Interest rules" in output
+        assert "Thank you for banking with AwesomeGIC Bank" in output
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
\ No newline at end of file